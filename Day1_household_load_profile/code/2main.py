@@ -4,12 +4,42 @@ Energy System Manager Portfolio Project
 Based on actual appliance data for 5-person household
 """
 
+import functools
+import os
+
 import pandas as pd
 import numpy as np
+import matplotlib
+if not os.environ.get('DISPLAY'):
+    matplotlib.use('Agg')  # headless batch runs: skip GUI backend startup
 import matplotlib.pyplot as plt
 import matplotlib as mpl
 from datetime import datetime, timedelta
-import seaborn as sns
+
+try:
+    import numexpr as ne  # fuses compound boolean expressions on large frames
+except ImportError:
+    ne = None
+
+# 24-hour axis constants shared by every profile builder and plot
+HOURS = np.arange(24)
+HOUR_LABELS = [f"{h:02d}:00" for h in range(24)]
+X_TICK_LABELS = tuple(HOUR_LABELS[::2])  # static 2-hour ticks for the dashboard
+
+# ============================================================================
+# 0. FAST CSV EXPORT HELPER
+# ============================================================================
+
+def write_csv(df, path):
+    """Write a DataFrame to CSV, using pyarrow's vectorized writer when
+    available (pandas' default writer works row by row in Python)"""
+    try:
+        import pyarrow
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        df.to_csv(path, index=False)
+        return
+    pa_csv.write_csv(pyarrow.Table.from_pandas(df, preserve_index=False), path)
 
 # ============================================================================
 # 1. LOAD AND PROCESS APPLIANCE DATA
@@ -37,6 +67,7 @@ def load_appliance_data():
     }
     
     df = pd.DataFrame(appliance_data)
+    df['Usage_Pattern'] = df['Usage_Pattern'].astype('category')
     df['Daily_Energy_Wh'] = df['Quantity'] * df['Power_W'] * df['Daily_Hours']
     df['Power_kW'] = df['Quantity'] * df['Power_W'] / 1000
     
@@ -49,18 +80,39 @@ def load_appliance_data():
 # 2. CREATE HOURLY LOAD PROFILE BASED ON BEHAVIORAL PATTERNS
 # ============================================================================
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the plain-Python kernel still works
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _assemble_load(base_load, activity_hours, activity_loads):
+    """Load-assembly kernel: base load + activity patterns + AC overlays.
+
+    Kept free of pandas/dict lookups so numba can compile it to machine
+    code for parametric sweeps (many households / many days)."""
+    out = np.full(24, base_load, dtype=np.float32)
+    for i in range(activity_hours.shape[0]):
+        out[activity_hours[i]] = activity_loads[i]
+    # Evening AC (19:00-23:00): Living room AC
+    for h in range(19, 23):
+        out[h] += 1.0
+    # Night AC (22:00-02:00): Bedroom ACs (two units)
+    for h in (22, 23, 0, 1):
+        out[h] += 1.8
+    return out
+
+
 def create_hourly_profile():
     """Create realistic hourly load profile for Abuja household"""
-    
-    hours = list(range(24))
-    hour_labels = [f"{h:02d}:00" for h in hours]
-    
+
     # Base load (always on: fridge, router)
     base_load = 0.16  # kW (160W: fridge + router)
     
-    # Initialize hourly load array
-    hourly_load = [base_load] * 24
-    
     # Define activity patterns (in kW)
     # Format: {hour: additional_load, description}
     activity_patterns = {
@@ -101,32 +153,26 @@ def create_hourly_profile():
         23: 0.6    # Fans only
     }
     
-    # Apply activity patterns
-    for hour, load in activity_patterns.items():
-        hourly_load[hour] = load
-    
-    # Add AC patterns (based on Abuja climate)
-    # Evening AC (19:00-23:00): Living room AC
-    for h in range(19, 23):
-        hourly_load[h] += 1.0  # Living room AC
-    
-    # Night AC (22:00-02:00): Bedroom ACs
-    for h in [22, 23, 0, 1]:
-        if h < 24:
-            hourly_load[h] += 1.8  # Two bedroom ACs
+    # Apply activity patterns and AC overlays (based on Abuja climate)
+    # via the compiled assembly kernel (float32 output: plenty for kW
+    # readings, and halves the footprint once the profile scales)
+    activity_hours = np.array(list(activity_patterns.keys()), dtype=np.int64)
+    activity_loads = np.array(list(activity_patterns.values()), dtype=np.float32)
+    hourly_load = _assemble_load(base_load, activity_hours, activity_loads)
     
     # Create DataFrame
     df_hourly = pd.DataFrame({
-        'Hour': hours,
-        'Hour_Label': hour_labels,
-        'Load_kW': hourly_load,
-        'Load_kWh': hourly_load  # For 1-hour intervals, kWh = kW
+        'Hour': HOURS,
+        'Hour_Label': HOUR_LABELS,
+        'Load_kW': hourly_load  # For 1-hour intervals, kWh = kW
     })
     
-    # Add time-of-day categories
-    df_hourly['Time_Of_Day'] = pd.cut(df_hourly['Hour'], 
-                                       bins=[-1, 6, 12, 18, 24],
-                                       labels=['Night', 'Morning', 'Afternoon', 'Evening'])
+    # Add time-of-day categories (direct lookup - the hour grid is fixed,
+    # so no need for pd.cut's generic binning machinery)
+    period_lut = np.array(['Night'] * 7 + ['Morning'] * 6 +
+                          ['Afternoon'] * 6 + ['Evening'] * 5)
+    df_hourly['Time_Of_Day'] = pd.Categorical(
+        period_lut, categories=['Night', 'Morning', 'Afternoon', 'Evening'])
     
     return df_hourly
 
@@ -134,37 +180,42 @@ def create_hourly_profile():
 # 3. GRID RELIABILITY AND GENERATOR USAGE
 # ============================================================================
 
+# Abuja typical outage pattern (based on your input), indexed by hour
+# 0 = Grid available, 1 = Grid down
+_GRID_OUTAGE = np.array([
+    0, 0, 0, 1, 1, 1,   # 00-05: Night outages common
+    0, 0, 0, 0, 0, 0,   # 06-11: Morning usually stable
+    1, 1, 0, 0, 0, 0,   # 12-17: Afternoon outages
+    0, 1, 1, 1, 1, 0,   # 18-23: Evening outages
+], dtype=np.int8)
+
+
 def add_grid_simulation(df_hourly):
     """Simulate grid outages and generator usage"""
-    
-    # Abuja typical outage pattern (based on your input)
-    # 0 = Grid available, 1 = Grid down
-    grid_pattern = {
-        0: 0, 1: 0, 2: 0, 3: 1, 4: 1, 5: 1,  # Night outages common
-        6: 0, 7: 0, 8: 0, 9: 0, 10: 0, 11: 0,  # Morning usually stable
-        12: 1, 13: 1, 14: 0, 15: 0, 16: 0, 17: 0,  # Afternoon outages
-        18: 0, 19: 1, 20: 1, 21: 1, 22: 1, 23: 0   # Evening outages
-    }
-    
-    df_hourly['Grid_Available'] = df_hourly['Hour'].map(grid_pattern)
-    df_hourly['Grid_Available'] = 1 - df_hourly['Grid_Available']  # Invert: 1=available
-    
+
+    outage = _GRID_OUTAGE
+    grid_avail = (1 - outage).astype(np.int8)  # Invert: 1=available
+
     # Generator runs when grid is down AND load > 0.5 kW
-    df_hourly['Generator_Used'] = ((df_hourly['Grid_Available'] == 0) & 
-                                   (df_hourly['Load_kW'] > 0.5)).astype(int)
-    
-    # Calculate energy sources
-    df_hourly['Energy_Grid_kWh'] = df_hourly.apply(
-        lambda x: x['Load_kWh'] if x['Grid_Available'] == 1 else 0, axis=1)
-    
-    df_hourly['Energy_Generator_kWh'] = df_hourly.apply(
-        lambda x: x['Load_kWh'] if x['Generator_Used'] == 1 else 0, axis=1)
-    
-    # Some hours might have no power if grid is down and generator not used
-    df_hourly['Energy_Unserved_kWh'] = df_hourly.apply(
-        lambda x: x['Load_kWh'] if (x['Grid_Available'] == 0 and 
-                                    x['Generator_Used'] == 0) else 0, axis=1)
-    
+    load = df_hourly['Load_kW'].to_numpy()  # 1-hour intervals: kWh = kW
+    if ne is not None:
+        # single fused SIMD pass, no boolean temporaries
+        gen_used = ne.evaluate('(outage == 1) & (load > 0.5)')
+    else:
+        gen_used = (outage == 1) & (load > 0.5)
+    gen_used = gen_used.astype(np.int8)
+
+    # Attach every derived column in a single assign - one block
+    # consolidation instead of five incremental ones. Some hours might
+    # have no power if grid is down and generator not used.
+    df_hourly = df_hourly.assign(
+        Grid_Available=grid_avail,
+        Generator_Used=gen_used,
+        Energy_Grid_kWh=np.where(grid_avail == 1, load, 0.0),
+        Energy_Generator_kWh=np.where(gen_used == 1, load, 0.0),
+        Energy_Unserved_kWh=np.where((grid_avail == 0) & (gen_used == 0), load, 0.0),
+    )
+
     return df_hourly
 
 # ============================================================================
@@ -174,14 +225,17 @@ def add_grid_simulation(df_hourly):
 def calculate_metrics(df_hourly, df_appliances):
     """Calculate key energy metrics and costs"""
     
-    total_energy = df_hourly['Load_kWh'].sum()
-    peak_load = df_hourly['Load_kW'].max()
-    avg_load = df_hourly['Load_kW'].mean()
+    # Reduce on the raw ndarrays to skip pandas reduction dispatch
+    load = df_hourly['Load_kW'].to_numpy()  # 1-hour intervals: kWh = kW
+
+    total_energy = load.sum()
+    peak_load = load.max()
+    avg_load = load.mean()
     load_factor = avg_load / peak_load
-    
-    grid_energy = df_hourly['Energy_Grid_kWh'].sum()
-    generator_energy = df_hourly['Energy_Generator_kWh'].sum()
-    unserved_energy = df_hourly['Energy_Unserved_kWh'].sum()
+
+    grid_energy = df_hourly['Energy_Grid_kWh'].to_numpy().sum()
+    generator_energy = df_hourly['Energy_Generator_kWh'].to_numpy().sum()
+    unserved_energy = df_hourly['Energy_Unserved_kWh'].to_numpy().sum()
     
     # Abuja-specific costs (NGN)
     grid_tariff = 100  # NGN/kWh (average ₦90-₦110)
@@ -197,6 +251,7 @@ def calculate_metrics(df_hourly, df_appliances):
     metrics = {
         'total_energy_kwh': total_energy,
         'peak_load_kw': peak_load,
+        'peak_hour_label': df_hourly['Hour_Label'].iat[int(load.argmax())],
         'avg_load_kw': avg_load,
         'load_factor': load_factor,
         'grid_energy_kwh': grid_energy,
@@ -215,13 +270,20 @@ def calculate_metrics(df_hourly, df_appliances):
 # 5. VISUALIZATION FUNCTIONS
 # ============================================================================
 
-def create_visualizations(df_hourly, df_appliances, metrics):
-    """Create comprehensive visualizations"""
-    
+@functools.lru_cache(maxsize=1)
+def _apply_plot_style():
+    """Apply the shared plot style once per process (stylesheet parsing
+    and rcParams churn are not free on repeated calls)"""
     plt.style.use('seaborn-v0_8-darkgrid')
     mpl.rcParams['font.size'] = 10
     mpl.rcParams['axes.titlesize'] = 14
-    
+
+
+def create_visualizations(df_hourly, df_appliances, metrics):
+    """Create comprehensive visualizations"""
+
+    _apply_plot_style()
+
     # Figure 1: Main load profile
     fig1, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
     
@@ -231,14 +293,17 @@ def create_visualizations(df_hourly, df_appliances, metrics):
     ax1.set_title('Abuja Household: 24-Hour Load Profile', fontweight='bold', pad=15)
     ax1.set_xlabel('Hour of Day')
     ax1.set_ylabel('Load (kW)')
-    ax1.set_xticks(df_hourly['Hour_Label'][::2])
+    ax1.set_xticks(X_TICK_LABELS)
     ax1.grid(True, alpha=0.3)
     
-    # Add annotations for peaks
-    peak_hour = df_hourly.loc[df_hourly['Load_kW'].idxmax(), 'Hour_Label']
-    ax1.annotate(f'Peak: {metrics["peak_load_kw"]:.1f} kW\n({peak_hour})', 
-                xy=(df_hourly['Load_kW'].idxmax(), metrics["peak_load_kw"]),
-                xytext=(10, metrics["peak_load_kw"] * 0.8),
+    # Add annotations for peaks (one argmax pass instead of two idxmax calls)
+    load_arr = df_hourly['Load_kW'].to_numpy()
+    peak_idx = int(load_arr.argmax())
+    peak_val = load_arr[peak_idx]
+    peak_lbl = df_hourly['Hour_Label'].iat[peak_idx]
+    ax1.annotate(f'Peak: {peak_val:.1f} kW\n({peak_lbl})',
+                xy=(peak_idx, peak_val),
+                xytext=(10, peak_val * 0.8),
                 arrowprops=dict(arrowstyle='->', color='darkred'),
                 fontweight='bold')
     
@@ -256,12 +321,14 @@ def create_visualizations(df_hourly, df_appliances, metrics):
     plt.tight_layout()
     plt.savefig('abuja_load_profile_main.png', dpi=300, bbox_inches='tight')
     plt.show()
-    
+    plt.close(fig1)  # release the canvas buffer for batch runs
+
+
     # Figure 2: Appliance analysis
     fig2, (ax3, ax4) = plt.subplots(1, 2, figsize=(15, 6))
     
-    # Top energy-consuming appliances
-    top_5 = df_appliances.nlargest(5, 'Daily_Energy_Wh')
+    # Top energy-consuming appliances (already computed in calculate_metrics)
+    top_5 = metrics['top_appliances']
     ax3.barh(top_5['Appliance'], top_5['Daily_Energy_Wh'] / 1000, color='#2E86AB')
     ax3.set_xlabel('Daily Energy (kWh)')
     ax3.set_title('Top 5 Energy-Consuming Appliances', pad=15)
@@ -282,7 +349,9 @@ def create_visualizations(df_hourly, df_appliances, metrics):
     plt.tight_layout()
     plt.savefig('abuja_appliance_analysis.png', dpi=300, bbox_inches='tight')
     plt.show()
-    
+    plt.close(fig2)
+
+
     # Figure 3: Cost analysis
     fig3, ax5 = plt.subplots(figsize=(10, 6))
     
@@ -303,6 +372,7 @@ def create_visualizations(df_hourly, df_appliances, metrics):
     plt.tight_layout()
     plt.savefig('abuja_energy_costs.png', dpi=300, bbox_inches='tight')
     plt.show()
+    plt.close(fig3)
 
 # ============================================================================
 # 6. MAIN ANALYSIS FUNCTION
@@ -333,8 +403,10 @@ def main():
     
     # Save data to CSV
     print("💾 Saving data files...")
-    df_appliances.to_csv('abuja_appliance_data.csv', index=False)
-    df_hourly.to_csv('abuja_hourly_load_profile.csv', index=False)
+    write_csv(df_appliances, 'abuja_appliance_data.csv')
+    # Load_kWh duplicates Load_kW in memory; materialize it only on export
+    write_csv(df_hourly.assign(Load_kWh=df_hourly['Load_kW']),
+              'abuja_hourly_load_profile.csv')
     
     # Create visualizations
     print("🎨 Generating visualizations...")
@@ -373,8 +445,9 @@ def main():
 """
     print(summary)
     
-    for idx, row in metrics['top_appliances'].iterrows():
-        print(f"  {row['Appliance']}: {row['Daily_Energy_Wh']/1000:.1f} kWh/day")
+    top = metrics['top_appliances']
+    for name, wh in zip(top['Appliance'].to_numpy(), top['Daily_Energy_Wh'].to_numpy()):
+        print(f"  {name}: {wh/1000:.1f} kWh/day")
     
     print("\n" + "=" * 70)
     print("KEY INSIGHTS FOR ENERGY SYSTEM MANAGER")
@@ -404,7 +477,7 @@ def main():
 """.format(
         (metrics['generator_energy_kwh'] / metrics['total_energy_kwh']) * 100,
         metrics['peak_load_kw'],
-        df_hourly.loc[df_hourly['Load_kW'].idxmax(), 'Hour_Label'],
+        metrics['peak_hour_label'],
         int(metrics['total_daily_cost_ngn'] * 30),
         metrics['load_factor']
     )
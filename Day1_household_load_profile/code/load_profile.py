@@ -3,16 +3,36 @@ Energy Demand Modeling: Nigerian Household Load Profile
 Professional Analysis for Energy System Management Portfolio
 """
 
+import functools
+
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib as mpl
 from datetime import datetime
 
+# 24-hour axis constants shared across the profile builders
+HOURS = np.arange(24)
+HOUR_LABELS = [f"{h:02d}:00" for h in range(24)]
+X_TICK_LABELS = tuple(HOUR_LABELS[::2])  # static 2-hour ticks for the dashboard
+
+
+def write_csv(df, path):
+    """Write a DataFrame to CSV, using pyarrow's vectorized writer when
+    available (pandas' default writer works row by row in Python)"""
+    try:
+        import pyarrow
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        df.to_csv(path, index=False)
+        return
+    pa_csv.write_csv(pyarrow.Table.from_pandas(df, preserve_index=False), path)
+
 # ============================================================================
 # 1. HOUSEHOLD DATA MODELING
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def create_household_model():
     """Create professional household energy model"""
     
@@ -31,8 +51,12 @@ def create_household_model():
 # 2. APPLIANCE INVENTORY MODELING
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def create_appliance_model():
-    """Energy consumption model based on typical household appliances"""
+    """Energy consumption model based on typical household appliances.
+
+    The inventory is fixed, so the built frame is cached: repeat calls in
+    scenario sweeps skip the DataFrame construction entirely."""
     
     appliances = [
         ["Refrigerator", 1, 150, 24, "Continuous operation"],
@@ -71,12 +95,13 @@ def create_appliance_model():
 # 3. HOURLY LOAD PROFILE MODELING
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def generate_load_profile():
-    """Generate 24-hour load profile based on consumption patterns"""
-    
-    hours = list(range(24))
-    hour_labels = [f"{h:02d}:00" for h in hours]
-    
+    """Generate 24-hour load profile based on consumption patterns.
+
+    The pattern is deterministic, so the frame is built once per process
+    and reused on subsequent calls."""
+
     # Base load (always-on appliances)
     base_load = 0.35
     hourly_load = [base_load] * 24
@@ -114,14 +139,18 @@ def generate_load_profile():
     for h in range(18, 23):
         hourly_load[h] += 0.15
     
+    # Time-period lookup (hours are a fixed 0-23 grid, so a direct LUT
+    # replaces pd.cut's generic binning)
+    period_lut = np.array(['Night'] * 7 + ['Morning'] * 6 +
+                          ['Afternoon'] * 6 + ['Evening'] * 5)
+
     # Create DataFrame
     df_hourly = pd.DataFrame({
-        'Hour': hours,
-        'Hour_Label': hour_labels,
-        'Load_kW': hourly_load,
-        'Time_Period': pd.cut(hours, 
-                             bins=[-1, 6, 12, 18, 24],
-                             labels=['Night', 'Morning', 'Afternoon', 'Evening'])
+        'Hour': HOURS,
+        'Hour_Label': HOUR_LABELS,
+        'Load_kW': np.asarray(hourly_load, dtype=np.float32),
+        'Time_Period': pd.Categorical(
+            period_lut, categories=['Night', 'Morning', 'Afternoon', 'Evening'])
     })
     
     # Grid availability model
@@ -141,9 +170,9 @@ def generate_load_profile():
 # 4. ENERGY METRICS AND COST ANALYSIS
 # ============================================================================
 
-def calculate_energy_metrics(df_hourly):
+def calculate_energy_metrics(df_hourly, df_appliances):
     """Calculate energy performance metrics and costs"""
-    
+
     daily_kwh = df_hourly['Load_kW'].sum()
     peak_kw = df_hourly['Load_kW'].max()
     peak_hour = df_hourly.loc[df_hourly['Load_kW'].idxmax(), 'Hour_Label']
@@ -159,8 +188,12 @@ def calculate_energy_metrics(df_hourly):
     grid_cost = grid_energy * grid_tariff
     generator_fuel = generator_energy * generator_efficiency
     generator_cost = generator_fuel * diesel_price
-    
+
+    # Appliance-level insights (computed once, reused by the dashboard)
+    top_appliances = df_appliances.nlargest(5, 'Daily_Energy_kWh')
+
     metrics = {
+        'top_appliances': top_appliances,
         'daily_kwh': daily_kwh,
         'peak_kw': peak_kw,
         'peak_hour': peak_hour,
@@ -183,16 +216,22 @@ def calculate_energy_metrics(df_hourly):
 # 5. PROFESSIONAL VISUALIZATION
 # ============================================================================
 
-def create_visualization_dashboard(df_hourly, df_appliances, metrics):
-    """Create professional visualization dashboard"""
-    
-    # Professional styling
+@functools.lru_cache(maxsize=1)
+def _apply_plot_style():
+    """Apply professional styling once per process instead of re-parsing
+    the stylesheet on every dashboard call"""
     plt.style.use('seaborn-v0_8-whitegrid')
     mpl.rcParams['font.size'] = 9
     mpl.rcParams['axes.titlesize'] = 12
     mpl.rcParams['axes.labelsize'] = 10
     mpl.rcParams['figure.figsize'] = [14, 10]
-    
+
+
+def create_visualization_dashboard(df_hourly, df_appliances, metrics):
+    """Create professional visualization dashboard"""
+
+    _apply_plot_style()
+
     # Create figure with custom layout
     fig = plt.figure(constrained_layout=True)
     gs = fig.add_gridspec(3, 3)
@@ -200,16 +239,14 @@ def create_visualization_dashboard(df_hourly, df_appliances, metrics):
     # 1. Main Load Profile Chart
     ax1 = fig.add_subplot(gs[0, :2])
     
-    # Color coding for energy sources
-    colors = []
-    for idx, row in df_hourly.iterrows():
-        if row['Generator_Used'] == 1:
-            colors.append('#E67E22')  # Orange for generator
-        elif row['Hour'] >= 19 and row['Hour'] <= 22:
-            colors.append('#2980B9')  # Blue for evening
-        else:
-            colors.append('#7F8C8D')  # Gray for other
-    
+    # Color coding for energy sources (vectorized)
+    hour = df_hourly['Hour'].to_numpy()
+    gen = df_hourly['Generator_Used'].to_numpy()
+    colors = np.select([gen == 1, (hour >= 19) & (hour <= 22)],
+                       ['#E67E22', '#2980B9'],  # Orange generator, blue evening
+                       default='#7F8C8D')       # Gray for other hours
+
+
     bars = ax1.bar(df_hourly['Hour_Label'], df_hourly['Load_kW'], 
                    color=colors, edgecolor='white', linewidth=0.5)
     
@@ -217,7 +254,7 @@ def create_visualization_dashboard(df_hourly, df_appliances, metrics):
                   fontsize=14, fontweight='bold', pad=15)
     ax1.set_xlabel('Hour of Day', fontweight='bold')
     ax1.set_ylabel('Electrical Load (kW)', fontweight='bold')
-    ax1.set_xticks(df_hourly['Hour_Label'][::2])
+    ax1.set_xticks(X_TICK_LABELS)
     ax1.grid(True, alpha=0.3, axis='y')
     
     # Peak demand annotation
@@ -252,7 +289,7 @@ def create_visualization_dashboard(df_hourly, df_appliances, metrics):
     # 3. Top Energy-Consuming Appliances
     ax3 = fig.add_subplot(gs[1, 0])
     
-    top_5 = df_appliances.nlargest(5, 'Daily_Energy_kWh')
+    top_5 = metrics['top_appliances']
     bars3 = ax3.barh(top_5['Appliance'], top_5['Daily_Energy_kWh'], 
                      color='#2980B9', alpha=0.8)
     ax3.set_xlabel('Daily Energy (kWh)', fontweight='bold')
@@ -314,16 +351,22 @@ Monthly Estimate: ₦{metrics['total_daily_cost_ngn']*30:,.0f}
     # 6. Time-of-Day Analysis
     ax6 = fig.add_subplot(gs[2, :])
     
-    time_groups = df_hourly.groupby('Time_Period')['Load_kW'].mean().reindex(['Morning', 'Afternoon', 'Evening', 'Night'])
-    
-    bars6 = ax6.bar(time_groups.index, time_groups.values, 
+    # Mean load per time period via direct slices - the hour axis is a
+    # fixed 0-23 grid, so a groupby over the Categorical is pure overhead
+    load = df_hourly['Load_kW'].to_numpy()
+    period_slices = {'Morning': (7, 13), 'Afternoon': (13, 19),
+                     'Evening': (19, 24), 'Night': (0, 7)}
+    period_means = {name: load[lo:hi].mean()
+                    for name, (lo, hi) in period_slices.items()}
+
+    bars6 = ax6.bar(list(period_means), list(period_means.values()),
                     color=['#3498DB', '#2ECC71', '#E74C3C', '#9B59B6'])
     ax6.set_xlabel('Time Period', fontweight='bold')
     ax6.set_ylabel('Average Load (kW)', fontweight='bold')
     ax6.set_title('Load Distribution by Time Period', fontweight='bold', pad=10)
     ax6.grid(True, alpha=0.3, axis='y')
     
-    for i, v in enumerate(time_groups.values):
+    for i, v in enumerate(period_means.values()):
         ax6.text(i, v + 0.03, f'{v:.2f} kW', ha='center', fontweight='bold')
     
     # Main title
@@ -351,7 +394,9 @@ Monthly Estimate: ₦{metrics['total_daily_cost_ngn']*30:,.0f}
     plt.tight_layout()
     plt.savefig('load_duration_analysis.png', dpi=300, bbox_inches='tight', facecolor='white')
     plt.show()
-    
+    plt.close(fig2)  # release canvas buffers; fig stays usable for the caller
+    plt.close(fig)
+
     return fig
 
 # ============================================================================
@@ -362,9 +407,21 @@ def generate_analysis_report(metrics, df_hourly):
     """Generate professional analysis report"""
     
     generator_percent = (metrics['generator_energy_kwh'] / metrics['daily_kwh']) * 100
-    evening_load_percent = df_hourly[df_hourly['Hour'].between(18, 23)]['Load_kW'].sum() / metrics['daily_kwh'] * 100
-    
-    report = f"""
+    # Hour is a monotonic 0-23 index, so positional slices replace the
+    # between() boolean masks (no mask allocation, no filtered copy)
+    load = df_hourly['Load_kW'].to_numpy()
+    evening_load_percent = load[18:24].sum() / metrics['daily_kwh'] * 100
+    base_load_kw = load.min()
+    
+    # Hoist reused metrics to locals: one dict lookup each instead of
+    # repeating them throughout the template
+    daily_kwh = metrics['daily_kwh']
+    peak_kw = metrics['peak_kw']
+    daily_cost = metrics['total_daily_cost_ngn']
+    gen_hours = metrics['generator_hours']
+
+    parts = [
+        """
 ENERGY SYSTEM ANALYSIS REPORT
 ==============================
 
@@ -373,39 +430,39 @@ This analysis models the energy consumption patterns of a typical middle-income
 Nigerian household. The model incorporates intermittent grid supply patterns
 and backup generator usage, providing insights into demand characteristics
 and optimization opportunities.
-
-KEY FINDINGS
+""",
+        f"""KEY FINDINGS
 ------------
-1. DAILY ENERGY CONSUMPTION: {metrics['daily_kwh']:.1f} kWh
-2. PEAK DEMAND: {metrics['peak_kw']:.1f} kW at {metrics['peak_hour']}
+1. DAILY ENERGY CONSUMPTION: {daily_kwh:.1f} kWh
+2. PEAK DEMAND: {peak_kw:.1f} kW at {metrics['peak_hour']}
 3. LOAD FACTOR: {metrics['load_factor']:.2f} (Industry benchmark: >0.5)
 4. GENERATOR DEPENDENCY: {generator_percent:.1f}% of total energy
 5. EVENING LOAD CONCENTRATION: {evening_load_percent:.1f}% of daily consumption
-
-ENERGY SUPPLY ANALYSIS
+""",
+        f"""ENERGY SUPPLY ANALYSIS
 ----------------------
 • Grid Reliability: Limited during evening peak hours (7-11 PM)
-• Backup Power: Diesel generator operational {metrics['generator_hours']} hours daily
+• Backup Power: Diesel generator operational {gen_hours} hours daily
 • Fuel Consumption: {metrics['generator_fuel_liters']:.1f} liters diesel per day
-
-FINANCIAL IMPLICATIONS
+""",
+        f"""FINANCIAL IMPLICATIONS
 ----------------------
-• Daily Energy Cost: ₦{metrics['total_daily_cost_ngn']:,.0f}
-• Monthly Expenditure: ₦{metrics['total_daily_cost_ngn']*30:,.0f}
-• Annual Energy Budget: ₦{metrics['total_daily_cost_ngn']*365:,.0f}
+• Daily Energy Cost: ₦{daily_cost:,.0f}
+• Monthly Expenditure: ₦{daily_cost*30:,.0f}
+• Annual Energy Budget: ₦{daily_cost*365:,.0f}
 • Generator Fuel Cost: ₦{metrics['generator_cost_ngn']*30:,.0f} monthly
-
-SYSTEM CHARACTERISTICS
+""",
+        f"""SYSTEM CHARACTERISTICS
 ----------------------
-• Peak-to-Average Ratio: {(metrics['peak_kw']/metrics['avg_kw']):.2f}:1
-• Evening Demand Multiplier: {df_hourly[df_hourly['Hour'].between(19,21)]['Load_kW'].mean()/df_hourly['Load_kW'].min():.1f}x base load
+• Peak-to-Average Ratio: {(peak_kw/metrics['avg_kw']):.2f}:1
+• Evening Demand Multiplier: {load[19:22].mean()/base_load_kw:.1f}x base load
 • Load Concentration: {evening_load_percent:.1f}% of demand within 5-hour window
-
-RECOMMENDATIONS
+""",
+        f"""RECOMMENDATIONS
 ---------------
 1. ENERGY STORAGE INTEGRATION
    • Implement 5-10 kWh battery system for evening peak shaving
-   • Potential to eliminate {metrics['generator_hours']} hours of generator operation
+   • Potential to eliminate {gen_hours} hours of generator operation
 
 2. DEMAND-SIDE MANAGEMENT
    • Schedule non-essential loads outside 7-11 PM window
@@ -421,9 +478,11 @@ RECOMMENDATIONS
 
 This analysis provides a foundation for developing comprehensive energy
 management strategies, considering both technical and economic factors.
-"""
-    
-    return report
+""",
+    ]
+
+    return "\n".join(parts)
+
 
 # ============================================================================
 # MAIN EXECUTION FUNCTION
@@ -459,12 +518,16 @@ def main():
     # Step 3: Load profile generation
     print("\n3. Generating 24-hour load profile...")
     df_hourly = generate_load_profile()
-    print(f"   • Peak Demand Period: {df_hourly.loc[df_hourly['Load_kW'].idxmax(), 'Hour_Label']}")
+    # Single pass over the load column for every stat main() reports
+    load = df_hourly['Load_kW'].to_numpy()
+    load_stats = {'min': load.min(), 'max': load.max(), 'mean': load.mean(),
+                  'sum': load.sum(), 'argmax': int(load.argmax())}
+    print(f"   • Peak Demand Period: {df_hourly['Hour_Label'].iat[load_stats['argmax']]}")
     print(f"   • Generator Operation: {df_hourly['Generator_Used'].sum()} hours")
     
     # Step 4: Metrics calculation
     print("\n4. Calculating energy performance metrics...")
-    metrics = calculate_energy_metrics(df_hourly)
+    metrics = calculate_energy_metrics(df_hourly, df_appliances)
     print(f"   • Daily Energy: {metrics['daily_kwh']:.1f} kWh")
     print(f"   • Peak Load: {metrics['peak_kw']:.1f} kW")
     print(f"   • Load Factor: {metrics['load_factor']:.2f}")
@@ -475,8 +538,8 @@ def main():
     
     # Step 6: Data export
     print("\n6. Exporting analysis data...")
-    df_appliances.to_csv('household_appliance_data.csv', index=False)
-    df_hourly.to_csv('hourly_load_profile.csv', index=False)
+    write_csv(df_appliances, 'household_appliance_data.csv')
+    write_csv(df_hourly, 'hourly_load_profile.csv')
     
     # Step 7: Generate report
     print("\n7. Generating professional analysis report...")
@@ -496,8 +559,8 @@ KEY PERFORMANCE INDICATORS:
 • Daily Energy Cost: ₦{metrics['total_daily_cost_ngn']:,.0f}
 
 DEMAND CHARACTERISTICS:
-• Evening Load Concentration: {df_hourly[df_hourly['Hour'].between(18,23)]['Load_kW'].sum()/metrics['daily_kwh']*100:.1f}%
-• Peak-to-Base Ratio: {metrics['peak_kw']/df_hourly['Load_kW'].min():.1f}:1
+• Evening Load Concentration: {load[18:24].sum()/metrics['daily_kwh']*100:.1f}%
+• Peak-to-Base Ratio: {metrics['peak_kw']/load_stats['min']:.1f}:1
 • Generator Operation: {metrics['generator_hours']} hours daily
 
 FINANCIAL ANALYSIS: